@@ -1,5 +1,7 @@
 import argparse
+import datetime as dt
 import os
+import threading
 import time
 from pathlib import Path
 
@@ -7,10 +9,11 @@ import structlog
 from dotenv import load_dotenv
 from playsound3 import playsound
 
-from ai_baby_monitor.config import load_room_config_file
+from ai_baby_monitor.config import configure_logging, load_room_config_file
 from ai_baby_monitor.stream import RedisStreamHandler
 from ai_baby_monitor.watcher import Watcher
 
+configure_logging()
 logger = structlog.get_logger()
 
 load_dotenv()
@@ -18,7 +21,9 @@ REDIS_HOST = "localhost"
 REDIS_PORT = os.getenv("REDIS_PORT")
 VLLM_HOST = "localhost"
 VLLM_PORT = os.getenv("VLLM_PORT")
-LLM_MODEL_NAME = os.getenv("LLM_MODEL_NAME")
+LLM_MODEL_NAME = os.getenv("LLM_MODEL_NAME", "Qwen/Qwen2.5-VL-7B-Instruct-AWQ")
+# Re-analyze a static scene at least this often, so the verdict doesn't go stale
+STATIC_SCENE_MAX_SKIP = dt.timedelta(seconds=30)
 
 
 def run_watcher(
@@ -44,53 +49,110 @@ def run_watcher(
         model_name: Model name to use for inference (from room config).
         num_frames_to_process: Number of frames to analyze in each batch.
     """
-    # Initialize Redis stream handler
-    redis_handler = RedisStreamHandler(
-        redis_host=redis_host,
-        redis_port=redis_port,
-    )
+    # Tag every log line with the room, since several watchers may share a process
+    log = logger.bind(room=redis_stream_key)
 
-    # Initialize Watcher
-    nanny_watcher = Watcher(
-        instructions=instructions,
-        vllm_host=vllm_host,
-        vllm_port=vllm_port,
-        model_name=model_name,
-    )
+    try:
+        # Initialize Redis stream handler
+        redis_handler = RedisStreamHandler(
+            redis_host=redis_host,
+            redis_port=redis_port,
+        )
+
+        # Initialize Watcher
+        nanny_watcher = Watcher(
+            instructions=instructions,
+            vllm_host=vllm_host,
+            vllm_port=vllm_port,
+            model_name=model_name,
+        )
+        nanny_watcher.log_server_config()
+        nanny_watcher.warmup()
+    except Exception as e:
+        log.error("Failed to start watcher", error=str(e))
+        raise
 
     # Subsampled stream key
     subsampled_key = f"{redis_stream_key}:subsampled"
     logs_key = f"{redis_stream_key}:logs"
-    logger.info(
+    log.info(
         "Starting Watcher monitoring Redis",
         video_queue_key=subsampled_key,
         logs_queue_key=logs_key,
     )
-    logger.info(
+    log.info(
         "Using model", model_name=model_name, vllm_host=vllm_host, vllm_port=vllm_port
     )
-    logger.info("Monitoring instructions", instructions=instructions)
+    log.info("Monitoring instructions", instructions=instructions)
+
+    # Newest frame of the last successfully analyzed window, and whether that
+    # verdict was an alert, to avoid analyzing a window twice
+    last_analyzed_frame = None
+    last_should_alert = False
+    alert_sound = None
+
+    def play_alert():
+        """Play in the background so the response keeps streaming, and don't stack
+        beeps while the previous one is still playing."""
+        nonlocal alert_sound
+        if not (alert_sound and alert_sound.is_alive()):
+            alert_sound = playsound("assets/alert.wav", block=False)
+
+    # Consecutive failed inferences, used to back off while vLLM is unavailable
+    failure_streak = 0
 
     try:
         while True:
             # Get latest frames from Redis
-            frames = redis_handler.get_latest_frames(
+            frame_entries = redis_handler.get_latest_frame_entries(
                 subsampled_key, num_frames_to_process
             )
+            frames = [frame for _, frame in frame_entries]
+            # Wait for frames after the newest one fetched, so a frame added before
+            # the wait starts still wakes it up
+            newest_id = frame_entries[-1][0] if frame_entries else "$"
 
-            if not frames:
-                logger.warning(
-                    "No frames available in stream", video_queue_key=subsampled_key
+            # A window needs at least 2 frames, see Watcher.process_frames
+            if len(frames) < 2:
+                log.warning(
+                    "Not enough frames available in stream",
+                    video_queue_key=subsampled_key,
+                    num_frames=len(frames),
+                )
+                # Sleep on the server until the producer adds a frame
+                redis_handler.wait_for_new_entries(
+                    subsampled_key, last_id=newest_id, block_ms=1000
                 )
-                time.sleep(0.3)
                 continue
 
-            logger.info("Analyzing frames from stream", num_frames=len(frames))
+            if last_analyzed_frame is not None:
+                # Inference finished before the producer added a frame, so this is
+                # the window that was just analyzed. Wait for a fresh frame instead.
+                # Likewise if nothing moved since then, as the verdict still holds.
+                # An alert is re-checked regardless, so it keeps sounding
+                since_analyzed = frames[-1].timestamp - last_analyzed_frame.timestamp
+                if since_analyzed == dt.timedelta(0) or (
+                    not last_should_alert
+                    and since_analyzed < STATIC_SCENE_MAX_SKIP
+                    and nanny_watcher.is_scene_unchanged(frames, last_analyzed_frame)
+                ):
+                    redis_handler.wait_for_new_entries(
+                        subsampled_key, last_id=newest_id, block_ms=1000
+                    )
+                    continue
 
-            # Process frames with Watcher
-            result = nanny_watcher.process_frames(frames)
+            log.info("Analyzing frames from stream", num_frames=len(frames))
+
+            # Process frames with Watcher. The alert sounds as soon as the model
+            # decides on it, without waiting for the reasoning
+            result = nanny_watcher.process_frames(frames, on_alert=play_alert)
 
             if result["success"]:
+                failure_streak = 0
+                # Only a verdict lets later windows of the same scene be skipped
+                last_analyzed_frame = frames[-1]
+                last_should_alert = result["should_alert"]
+
                 # Log the result
                 alert_status = (
                     "🚨 ALERT TRIGGERED"
@@ -99,7 +161,7 @@ def run_watcher(
                 )
                 awareness = result["recommended_awareness_level"]
 
-                logger.info(
+                log.info(
                     "Alert status and reasoning",
                     alert_status=alert_status,
                     awareness_level=awareness,
@@ -114,12 +176,9 @@ def run_watcher(
                     "reasoning": result["reasoning"],
                 }
                 redis_handler.add_logs(logs_key, log_data)
-
-                if result["should_alert"]:
-                    playsound("assets/alert.wav")
             else:
                 error_msg = result.get("error", "Unknown error")
-                logger.error("Error processing frames", error=error_msg)
+                log.error("Error processing frames", error=error_msg)
 
                 # Stream error to Redis
                 error_data = {
@@ -128,12 +187,17 @@ def run_watcher(
                 }
                 redis_handler.add_logs(logs_key, error_data)
 
-                time.sleep(0.3)
+                # Exponential back-off, from 0.3s up to 5s
+                time.sleep(min(5.0, 0.3 * 2**failure_streak))
+                failure_streak += 1
 
     except KeyboardInterrupt:
-        logger.info("Watcher stopped by user")
+        log.info("Watcher stopped by user")
     except Exception as e:
-        logger.error("Error in Watcher", error=e)
+        log.error("Error in Watcher", error=e)
+        raise
+    finally:
+        nanny_watcher.close()
 
 
 def parse_args():
@@ -142,7 +206,12 @@ def parse_args():
     )
 
     parser.add_argument(
-        "--config-file", required=True, help="Path to room configuration YAML file"
+        "--config-files",
+        "--config-file",
+        nargs="+",  # One watcher per room, all sharing the same vLLM server
+        required=True,
+        dest="config_files",
+        help="Paths to room configuration YAML files",
     )
     return parser.parse_args()
 
@@ -150,41 +219,75 @@ def parse_args():
 if __name__ == "__main__":
     args = parse_args()
 
-    try:
-        # Load room configuration from file
-        room_config = load_room_config_file(args.config_file)
-        config_file_path = Path(args.config_file)
+    watcher_kwargs = []
+    for config_file in args.config_files:
+        try:
+            # Load room configuration from file
+            room_config = load_room_config_file(config_file)
+        except FileNotFoundError:
+            logger.error(f"Configuration file not found: {config_file}")
+            exit(1)
+        except Exception as e:
+            logger.error("Failed to start watcher", error=str(e))
+            exit(1)
+
+        config_file_path = Path(config_file)
         logger.info(
             f"Loaded configuration for room: {room_config.name}",
             config_file=str(config_file_path.resolve()),
         )
 
-        # Extract parameters from config
-        redis_stream_key = room_config.name
-        instructions = room_config.instructions
-        num_frames_to_process = room_config.num_frames_to_process
-
         # Ensure instructions are provided, as RoomConfig defaults to an empty list if not in YAML.
-        if not instructions:
+        if not room_config.instructions:
             logger.error(
                 "The 'instructions' list is empty or missing in the configuration file. At least one instruction is required for the watcher.",
                 config_file=str(config_file_path.resolve()),
             )
             exit(1)
 
-        run_watcher(
-            redis_stream_key=redis_stream_key,
-            redis_host=REDIS_HOST,
-            redis_port=REDIS_PORT,
-            instructions=instructions,
-            vllm_host=VLLM_HOST,
-            vllm_port=VLLM_PORT,
-            model_name=LLM_MODEL_NAME,
-            num_frames_to_process=num_frames_to_process,
+        watcher_kwargs.append(
+            dict(
+                redis_stream_key=room_config.name,
+                redis_host=REDIS_HOST,
+                redis_port=REDIS_PORT,
+                instructions=room_config.instructions,
+                vllm_host=VLLM_HOST,
+                vllm_port=VLLM_PORT,
+                model_name=LLM_MODEL_NAME,
+                num_frames_to_process=room_config.num_frames_to_process,
+            )
         )
-    except FileNotFoundError:
-        logger.error(f"Configuration file not found: {args.config_file}")
-        exit(1)
-    except Exception as e:
-        logger.error("Failed to start watcher", error=str(e))
-        exit(1)
+
+    if len(watcher_kwargs) == 1:
+        try:
+            run_watcher(**watcher_kwargs[0])
+        except Exception:
+            # Already logged by run_watcher
+            exit(1)
+    else:
+        # Each room runs its own loop in a thread. The vLLM calls are I/O-bound,
+        # so concurrent requests let the server batch them together.
+        threads = [
+            threading.Thread(
+                target=run_watcher,
+                kwargs=kwargs,
+                name=kwargs["redis_stream_key"],
+                daemon=True,
+            )
+            for kwargs in watcher_kwargs
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            # A room whose watcher stopped must not go unnoticed while the others
+            # keep running, so exit as soon as any thread does
+            while all(thread.is_alive() for thread in threads):
+                time.sleep(1.0)
+        except KeyboardInterrupt:
+            logger.info("Watchers stopped by user")
+        else:
+            logger.error(
+                "Watcher stopped, exiting",
+                rooms=[thread.name for thread in threads if not thread.is_alive()],
+            )
+            exit(1)
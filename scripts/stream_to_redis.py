@@ -6,9 +6,10 @@ from pathlib import Path
 import structlog
 from dotenv import load_dotenv
 
-from ai_baby_monitor.config import load_room_config_file
+from ai_baby_monitor.config import configure_logging, load_room_config_file
 from ai_baby_monitor.stream import CameraStream, RedisStreamHandler
 
+configure_logging()
 logger = structlog.get_logger()
 
 load_dotenv()
@@ -26,6 +27,7 @@ def stream_to_redis(
     frame_width: int | None,
     frame_height: int | None,
     subsample_rate: int = 4,
+    jpeg_quality: int = 85,
 ):
     """
     Stream camera frames to Redis short realtime and long subsampled queues.
@@ -59,6 +61,7 @@ def stream_to_redis(
             uri=camera_uri,
             save_stream_path=save_stream_path,
             frame_shape=frame_shape,
+            jpeg_quality=jpeg_quality,
         )
 
         # Initialize Redis stream handler
@@ -69,31 +72,45 @@ def stream_to_redis(
 
         logger.info("Starting to stream to redis.")
 
+        # Consecutive failed captures, used to back off while the camera is down
+        failure_streak = 0
+
         # Main streaming loop
         while True:
             # Only capture when a new frame is available
             frame = camera.capture_new_frame()
             if frame:
+                failure_streak = 0
+
                 # Always add frame to realtime queue
-                redis_handler.add_frame(
-                    frame, f"{redis_stream_key}:realtime", 3, approximate=False
-                )
+                streams = [(f"{redis_stream_key}:realtime", 3, False)]
 
                 # Add to subsampled queue every nth frame
-                if frame.frame_idx % subsample_rate == 0:
-                    redis_handler.add_frame(
-                        frame,
-                        f"{redis_stream_key}:subsampled",
-                        subsampled_stream_maxlen,
+                is_subsampled = frame.frame_idx % subsample_rate == 0
+                if is_subsampled:
+                    streams.append(
+                        (
+                            f"{redis_stream_key}:subsampled",
+                            subsampled_stream_maxlen,
+                            True,
+                        )
                     )
+
+                # Both writes share one round trip to Redis
+                redis_handler.add_frame_to_streams(frame, streams)
+
+                # Log progress every 100 frames rather than on every write
+                if frame.frame_idx % 100 == 0:
                     logger.info(
-                        "Added frame to subsampled queue",
+                        "Streaming frames to redis",
                         frame_idx=frame.frame_idx,
                         timestamp=frame.timestamp,
                     )
             else:
                 logger.warning("Failed to capture frame, retrying...")
-                time.sleep(0.01)
+                # Exponential back-off, from 10ms up to 500ms
+                time.sleep(min(0.5, 0.01 * 2**failure_streak))
+                failure_streak += 1
 
     except KeyboardInterrupt:
         logger.info("Stream interrupted by user")
@@ -161,6 +178,7 @@ if __name__ == "__main__":
             frame_width=room_config.frame_width,
             frame_height=room_config.frame_height,
             subsample_rate=room_config.subsample_rate,
+            jpeg_quality=room_config.jpeg_quality,
         )
     except Exception as e:
         logger.error("Failed to start streaming", error=e)
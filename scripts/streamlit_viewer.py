@@ -5,12 +5,12 @@ import streamlit as st
 import structlog
 from dotenv import load_dotenv
 
-from ai_baby_monitor.config import load_multiple_room_configs
+from ai_baby_monitor.config import configure_logging, load_multiple_room_configs
 from ai_baby_monitor.ui import (
     display_sidebar,
     fetch_logs,
     get_cached_redis_handler,
-    get_last_image_with_timestamp,
+    get_last_image_and_logs,
     render_logs,
 )
 
@@ -18,6 +18,7 @@ load_dotenv()
 REDIS_HOST = os.getenv("REDIS_HOST")
 REDIS_PORT = os.getenv("REDIS_PORT")
 
+configure_logging()
 logger = structlog.get_logger()
 
 
@@ -58,32 +59,39 @@ display_sidebar(
 selected_config = st.session_state["selected_config"]
 selected_mode = st.session_state["selected_mode"]
 
+
+@st.fragment(run_every=0.2)
+def render_realtime_stream(room_name: str):
+    """Render the latest frame and LLM log. Reruns on its own timer without
+    re-executing the rest of the script."""
+    # Reuse the image while the latest frame hasn't changed
+    frame_state_key = f"{room_name}:last_frame"
+    last_image, last_frame_id, last_timestamp = st.session_state.get(
+        frame_state_key, (None, None, None)
+    )
+    # Frame and logs come back from Redis in a single round trip, and the frame
+    # only when it's newer than the one we already have
+    image, frame_id, timestamp, logs = get_last_image_and_logs(
+        redis_handler, room_name, last_frame_id, num_logs=1
+    )
+    if image is None:
+        image, timestamp = last_image, last_timestamp
+    else:
+        st.session_state[frame_state_key] = (image, frame_id, timestamp)
+
+    if image:
+        st.image(image, use_container_width=True)
+        with st.expander("Frame Info"):
+            st.caption(f"Timestamp: {timestamp}")
+
+    with st.container(height=350):
+        with st.expander("LLM Logs", expanded=True, icon="🤖"):
+            render_logs(logs)
+
+
 if selected_mode == "Real-time stream":
     st.title("Baby Monitor Stream Viewer")
-
-    # Placeholders for the stream and logs
-    stream_placeholder = st.empty()
-    log_placeholder = st.empty()
-
-    while True:
-        with stream_placeholder.container():
-            image, timestamp = get_last_image_with_timestamp(
-                redis_handler, selected_config.name
-            )
-            if image:
-                st.image(image, use_container_width=True)
-                with st.expander("Frame Info"):
-                    st.caption(f"Timestamp: {timestamp}")
-
-        with log_placeholder.container(height=350):
-            with st.expander("LLM Logs", expanded=True, icon="🤖"):
-                logs = fetch_logs(
-                    redis_handler,
-                    selected_config.name,
-                    num_logs=1,
-                )
-
-                render_logs(logs)
+    render_realtime_stream(selected_config.name)
 
 else:
     st.title("Baby Monitor Logs Viewer")
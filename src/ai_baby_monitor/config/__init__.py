@@ -1,6 +1,8 @@
+from .logging_config import configure_logging
 from .utils import RoomConfig, load_room_config_file, load_multiple_room_configs
 
 __all__ = [
+    "configure_logging",
     "RoomConfig",
     "load_room_config_file",
     "load_multiple_room_configs",
@@ -0,0 +1,16 @@
+import logging
+
+import structlog
+
+
+def configure_logging(level: int = logging.INFO):
+    """Configure structlog for a long-running process.
+
+    Calls below `level` return immediately from the bound logger instead of
+    running the processor chain, and loggers are cached after first use.
+    Must be called before the first log line is emitted.
+    """
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        cache_logger_on_first_use=True,
+    )
@@ -1,8 +1,15 @@
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 @dataclass(slots=True, kw_only=True)
 class RoomConfig:
@@ -14,20 +21,40 @@ class RoomConfig:
     frame_height: int = 360
     subsample_rate: int = 4
     num_frames_to_process: int = 16
+    jpeg_quality: int = 85
+
+    def __post_init__(self):
+        # The watcher needs at least 2 frames per window, so fewer would never be
+        # analyzed
+        if self.num_frames_to_process < 2:
+            raise ValueError(
+                "num_frames_to_process must be at least 2, "
+                f"got {self.num_frames_to_process}"
+            )
 
     def __str__(self):
         return self.name
 
 
 def load_room_config_file(config_path: str | Path) -> RoomConfig:
-    """Load a single room configuration from a specified YAML file"""
+    """Load a single room configuration from a specified YAML file.
+    Parsed configs are cached until the file's modification time changes.
+    """
     config_path = Path(config_path)
 
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
+    return _parse_room_config_file(
+        config_path.resolve(), config_path.stat().st_mtime_ns
+    )
+
+
+@lru_cache(maxsize=32)
+def _parse_room_config_file(config_path: Path, mtime_ns: int) -> RoomConfig:
+    """Parse a room config file. `mtime_ns` only takes part in the cache key."""
     try:
-        data = yaml.safe_load(config_path.read_text())
+        data = yaml.load(config_path.read_text(), Loader=SafeLoader)
         
         config_kwargs = {
             # Required fields
@@ -37,7 +64,8 @@ def load_room_config_file(config_path: str | Path) -> RoomConfig:
             
             # Optional fields (only include if specified in YAML)
             **{k: data["camera"][k] for k in 
-               ["subsampled_stream_maxlen", "frame_width", "frame_height", "subsample_rate", "num_frames_to_process"]
+               ["subsampled_stream_maxlen", "frame_width", "frame_height", "subsample_rate", "num_frames_to_process",
+                "jpeg_quality"]
                if k in data["camera"]}
         }
         
@@ -1,4 +1,4 @@
-from .camera_stream import CameraStream, Frame
+from .camera_stream import CameraStream, Frame, compute_dhash
 from .redis_stream import RedisStreamHandler
 
-__all__ = ["CameraStream", "Frame", "RedisStreamHandler"]
+__all__ = ["CameraStream", "Frame", "RedisStreamHandler", "compute_dhash"]
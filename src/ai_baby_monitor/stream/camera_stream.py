@@ -9,11 +9,23 @@ import structlog
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class Frame:
     frame_data: np.ndarray
     timestamp: dt.datetime
     frame_idx: int
+    dhash: int | None = None
+
+
+def compute_dhash(frame: np.ndarray) -> int:
+    """Compute a 64-bit difference hash of a BGR frame.
+    Visually similar frames have hashes with a small Hamming distance.
+    """
+    # Shrink first so the grayscale conversion only touches 72 pixels
+    small = cv2.resize(frame, (9, 8), interpolation=cv2.INTER_AREA)
+    gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    bits = gray[:, 1:] > gray[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
 
 
 class CameraStream:
@@ -22,6 +34,7 @@ class CameraStream:
         uri: str | int,
         save_stream_path: str | None = None,
         frame_shape: tuple[int, int] | None = None,
+        jpeg_quality: int = 85,
     ):
         """
         Simple camera stream handler.
@@ -30,11 +43,16 @@ class CameraStream:
             uri: Camera URI or device index
             save_stream_path: Path to save the stream
             frame_shape: Frame shape to capture. Would be resized to this shape if provided.
+            jpeg_quality: JPEG quality (0-100) used to encode the frames
         """
         self.frame_shape = frame_shape
+        self.jpeg_quality = jpeg_quality
         self.capture = self._init_capture(uri)
         self.stream_writer = self._init_stream_writer(save_stream_path)
         self.frame_idx = 0
+        # Reused between captures so retrieve() and resize() write into the same memory
+        self._raw_frame: np.ndarray | None = None
+        self._resized_frame: np.ndarray | None = None
 
     def _init_capture(self, uri: str | int, max_retries: int = 3) -> cv2.VideoCapture:
         """Initialize and return the camera capture."""
@@ -43,6 +61,8 @@ class CameraStream:
             try:
                 capture = cv2.VideoCapture(uri)
                 if capture.isOpened():
+                    # Keep only the newest frame so grab() never returns a stale one
+                    capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
                     logger.info("Successfully connected to RTSP stream", uri=uri)
                     return capture
                 raise ConnectionError("Failed to open RTSP stream")
@@ -81,24 +101,34 @@ class CameraStream:
             logger.warning("No frame available to grab")
             return None
 
-        # Retrieve the grabbed frame
-        ret, frame = self.capture.retrieve()
+        # Retrieve the grabbed frame into the reusable buffer
+        ret, frame = self.capture.retrieve(self._raw_frame)
         if not ret:
             logger.warning("Failed to retrieve grabbed frame")
             return None
+        self._raw_frame = frame
 
         timestamp = dt.datetime.now()
 
-        # Resize frame if needed
+        # Resize frame if needed. INTER_AREA is vectorized, and avoids aliasing
+        # when downscaling from the camera's resolution
         if self.frame_shape and (frame.shape[1], frame.shape[0]) != self.frame_shape:
-            frame = cv2.resize(frame, self.frame_shape)
+            frame = cv2.resize(
+                frame,
+                self.frame_shape,
+                dst=self._resized_frame,
+                interpolation=cv2.INTER_AREA,
+            )
+            self._resized_frame = frame
 
         # Write frame to stream writer if it exists
         if self.stream_writer:
             self.stream_writer.write(frame)
 
-        # Convert into jpeg
-        ret, jpeg = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 100])
+        # Convert into jpeg. Chroma is subsampled 4:2:0 by default
+        ret, jpeg = cv2.imencode(
+            ".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality]
+        )
         if not ret:
             logger.warning("Failed to encode frame as JPEG")
             return None
@@ -108,6 +138,7 @@ class CameraStream:
             frame_data=jpeg,
             timestamp=timestamp,
             frame_idx=self.frame_idx,
+            dhash=compute_dhash(frame),
         )
 
         self.frame_idx += 1
@@ -3,6 +3,7 @@ import datetime as dt
 import numpy as np
 import redis
 import structlog
+from redis.utils import HIREDIS_AVAILABLE
 
 from ai_baby_monitor.stream import Frame
 
@@ -14,6 +15,7 @@ class RedisStreamHandler:
         self,
         redis_host: str = "localhost",
         redis_port: int = 6379,
+        max_connections: int = 16,
     ):
         """
         Handler for streaming camera frames to Redis.
@@ -21,8 +23,24 @@ class RedisStreamHandler:
         Args:
             redis_host: Redis server host
             redis_port: Redis server port
+            max_connections: Size of the connection pool, which is shared by every
+                thread and Streamlit session using this handler
         """
-        self.redis_client = redis.Redis(host=redis_host, port=redis_port)
+        # Keepalive so idle pooled sockets aren't silently dropped between reads
+        pool = redis.ConnectionPool(
+            host=redis_host,
+            port=redis_port,
+            max_connections=max_connections,
+            socket_keepalive=True,
+        )
+        self.redis_client = redis.Redis(connection_pool=pool)
+
+        # redis-py picks the hiredis parser on its own when it's importable. Without
+        # it, every frame payload is parsed in pure Python
+        if not HIREDIS_AVAILABLE:
+            logger.warning(
+                "hiredis is not installed, falling back to the slow Python parser"
+            )
         logger.info(
             "Initialized Redis stream handler",
             redis_host=redis_host,
@@ -32,7 +50,12 @@ class RedisStreamHandler:
     @staticmethod
     def serialize_frame(frame: Frame) -> dict:
         """Serialize a Frame object to a dictionary for Redis storage."""
-        frame_bytes = frame.frame_data.tobytes()
+        # Expose the array buffer instead of copying it with tobytes(). Only redis-py's
+        # pure-Python packer sends memoryviews as-is; with hiredis installed, the
+        # packer still copies them to bytes. ascontiguousarray is a no-op for JPEG data.
+        # The view is cast to flat bytes, since redis-py takes len() of it as the
+        # payload size and len() of an N-D view is only its first dimension
+        frame_bytes = np.ascontiguousarray(frame.frame_data).data.cast("B")
 
         # Create the data dictionary
         data = {
@@ -40,6 +63,8 @@ class RedisStreamHandler:
             "timestamp": frame.timestamp.isoformat(),
             "frame_idx": frame.frame_idx,
         }
+        if frame.dhash is not None:
+            data["dhash"] = frame.dhash
         return data
 
     @staticmethod
@@ -62,6 +87,7 @@ class RedisStreamHandler:
                 frame_data=frame_array,
                 timestamp=timestamp,
                 frame_idx=int(frame_data[b"frame_idx"]),
+                dhash=int(frame_data[b"dhash"]) if b"dhash" in frame_data else None,
             )
         except Exception as e:
             logger.error("Error deserializing frame", error=e)
@@ -105,6 +131,51 @@ class RedisStreamHandler:
 
         return entry_id
 
+    def add_frames_batch(
+        self, frames: list[Frame], key: str, maxlen: int, approximate: bool = True
+    ) -> list[str]:
+        """Add several frames to a Redis stream in a single round trip.
+
+        Args:
+            frames: Frame objects to add, oldest first
+            key: Redis stream key
+            maxlen: Maximum length of the stream
+            approximate: Whether to use approximate length
+
+        Returns:
+            entry_ids: IDs of the added entries, in the order of `frames`
+        """
+        pipe = self.redis_client.pipeline(transaction=False)
+        for frame in frames:
+            pipe.xadd(
+                name=key,
+                fields=self.serialize_frame(frame),
+                maxlen=maxlen,
+                approximate=approximate,
+            )
+
+        return pipe.execute()
+
+    def add_frame_to_streams(
+        self, frame: Frame, streams: list[tuple[str, int, bool]]
+    ) -> list[str]:
+        """Add a frame to several Redis streams in a single round trip.
+
+        Args:
+            frame: Frame object to add to the streams
+            streams: (key, maxlen, approximate) for every target stream
+
+        Returns:
+            entry_ids: IDs of the added entries, in the order of `streams`
+        """
+        # Serialize once and queue one XADD per stream on a non-transactional pipeline
+        data = self.serialize_frame(frame)
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key, maxlen, approximate in streams:
+            pipe.xadd(name=key, fields=data, maxlen=maxlen, approximate=approximate)
+
+        return pipe.execute()
+
     def add_logs(
         self,
         key: str,
@@ -131,16 +202,85 @@ class RedisStreamHandler:
             ::-1
         ]
 
+    def wait_for_new_entries(
+        self,
+        key: str,
+        last_id: str | bytes = "$",
+        count: int = 1,
+        block_ms: int = 1000,
+    ) -> list[tuple[bytes, dict]]:
+        """Block until entries newer than `last_id` arrive on a Redis stream.
+        Uses XREAD BLOCK so the client sleeps on the server instead of polling.
+        The default `$` only waits for entries added after the call.
+        Returns an empty list if nothing arrives within `block_ms`.
+        """
+        response = self.redis_client.xread({key: last_id}, count=count, block=block_ms)
+        if not response:
+            return []
+        _, entries = response[0]
+        return entries
+
     def get_latest_frames(self, key: str, count: int = 1) -> list[Frame]:
         """Get the latest frames from the Redis stream."""
+        return [frame for _, frame in self.get_latest_frame_entries(key, count)]
+
+    def get_latest_frame_entries(
+        self, key: str, count: int = 1
+    ) -> list[tuple[bytes, Frame]]:
+        """Get the latest frames from the Redis stream, paired with their entry IDs.
+        The newest ID can be passed to `wait_for_new_entries` to wait for the frames
+        after it.
+        """
         entries = self.get_latest_entries(key=key, count=count)
+        return self._deserialize_entries(entries)
+
+    def get_latest_frames_multi(
+        self, keys: list[str], count: int = 1
+    ) -> dict[str, list[Frame]]:
+        """Get the latest frames from several Redis streams in a single round trip.
+        Frames of every stream are returned oldest first, keyed by stream key.
+        """
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.xrevrange(name=key, max="+", min="-", count=count)
+
+        return {
+            key: [frame for _, frame in self._deserialize_entries(entries[::-1])]
+            for key, entries in zip(keys, pipe.execute())
+        }
+
+    def get_latest_frames_and_logs(
+        self,
+        frames_key: str,
+        logs_key: str,
+        num_frames: int = 1,
+        num_logs: int = 1,
+        last_frame_id: bytes | None = None,
+    ) -> tuple[list[tuple[bytes, Frame]], list[tuple[bytes, dict]]]:
+        """Get the latest frames, paired with their entry IDs, and logs in a single
+        round trip. With `last_frame_id`, only frames added after that entry are
+        returned, so a caller that already has the newest frame doesn't receive it
+        again.
+        """
+        # "(" makes the range exclusive of the entry the caller already has
+        min_frame_id = f"({last_frame_id.decode()}" if last_frame_id else "-"
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.xrevrange(name=frames_key, max="+", min=min_frame_id, count=num_frames)
+        pipe.xrevrange(name=logs_key, max="+", min="-", count=num_logs)
+        frame_entries, log_entries = pipe.execute()
+
+        return self._deserialize_entries(frame_entries[::-1]), log_entries[::-1]
 
-        # Deserialize the frames
+    def _deserialize_entries(
+        self, entries: list[tuple[bytes, dict]]
+    ) -> list[tuple[bytes, Frame]]:
+        """Deserialize stream entries into (entry ID, frame) pairs, dropping invalid
+        ones."""
         frames = []
         for entry_id, data in entries:
             frame = self.deserialize_frame(data)
             if frame:
-                frames.append(frame)
+                frames.append((entry_id, frame))
 
         return frames
 
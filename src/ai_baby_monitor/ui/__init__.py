@@ -1,7 +1,7 @@
 from .streamlit_components import (
     get_cached_redis_handler,
     display_sidebar,
-    get_last_image_with_timestamp,
+    get_last_image_and_logs,
     fetch_logs,
     render_logs,
 )
@@ -9,7 +9,7 @@ from .streamlit_components import (
 __all__ = [
     "get_cached_redis_handler",
     "display_sidebar",
-    "get_last_image_with_timestamp",
+    "get_last_image_and_logs",
     "fetch_logs",
     "render_logs",
 ]
\ No newline at end of file
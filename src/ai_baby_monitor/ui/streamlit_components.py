@@ -1,9 +1,7 @@
 import datetime as dt
-import io
 import os
 
 import streamlit as st
-from PIL import Image
 
 from ai_baby_monitor.stream import RedisStreamHandler
 
@@ -52,17 +50,32 @@ def get_cached_redis_handler(redis_host: str, redis_port: int):
     )
 
 
-def get_last_image_with_timestamp(
-    redis_handler: RedisStreamHandler, room_name: str
-) -> tuple[Image.Image | None, dt.datetime | None]:
-    frames = redis_handler.get_latest_frames(f"{room_name}:realtime", count=1)
+def get_last_image_and_logs(
+    redis_handler: RedisStreamHandler,
+    room_name: str,
+    last_frame_id: bytes | None = None,
+    num_logs: int = 1,
+) -> tuple[bytes | None, bytes | None, dt.datetime | None, list[dict]]:
+    """Fetch the latest realtime frame and logs in a single Redis round trip.
+
+    Returns the JPEG bytes, entry ID and timestamp of the frame, and the parsed logs.
+    `st.image` accepts the JPEG bytes as is and leaves them for the browser to decode.
+    The frame fields are None when there is no frame newer than `last_frame_id`,
+    in which case Redis doesn't send the frame again.
+    """
+    frames, logs = redis_handler.get_latest_frames_and_logs(
+        f"{room_name}:realtime",
+        f"{room_name}:logs",
+        num_logs=num_logs,
+        last_frame_id=last_frame_id,
+    )
+    logs = _parse_logs(redis_handler, logs)
 
     if not frames:
-        return None
+        return None, None, None, logs
 
-    jpeg_bytes = bytes(frames[0].frame_data)
-    image = Image.open(io.BytesIO(jpeg_bytes))
-    return image, frames[0].timestamp
+    frame_id, frame = frames[-1]
+    return bytes(frame.frame_data), frame_id, frame.timestamp, logs
 
 
 def fetch_logs(
@@ -71,7 +84,12 @@ def fetch_logs(
     num_logs: int = 3,
 ) -> list[dict]:
     logs = redis_handler.get_latest_logs(f"{room_name}:logs", count=num_logs)
+    return _parse_logs(redis_handler, logs)
 
+
+def _parse_logs(
+    redis_handler: RedisStreamHandler, logs: list[tuple[bytes, dict]]
+) -> list[dict]:
     new_logs = []
     for log_id, log_data in logs:
         log_data = redis_handler.deserialize_log(log_data)
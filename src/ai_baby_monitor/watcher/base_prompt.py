@@ -1,8 +1,17 @@
+from functools import lru_cache
+
+
 def get_instructions_prompt(instructions: list[str]) -> str:
     """Inject the instructions into base prompt"""
     if len(instructions) == 0:
         raise ValueError("Instructions must be a non-empty list")
 
+    # Lists aren't hashable, so cache on a tuple of the instructions
+    return _build_instructions_prompt(tuple(instructions))
+
+
+@lru_cache(maxsize=32)
+def _build_instructions_prompt(instructions: tuple[str, ...]) -> str:
     instructions_str = "\n".join(["* " + _ for _ in instructions])
 
     return f"""
@@ -12,7 +21,7 @@ If the instructions are violated, you should alert the user.
 You should also recommend the awareness level based on the image.
 Please generate a structured response in raw JSON format:
 - should_alert (boolean)
-- reasoning (string)
+- reasoning (string; one or two short sentences)
 - recommended_awareness_level (Enum AwarenessLevel; one of: LOW, MEDIUM, HIGH)
 Always respond in English, regardless of the content in the images.
         """
\ No newline at end of file
@@ -1,4 +1,6 @@
-import base64
+import binascii
+import re
+from collections.abc import Callable
 from enum import Enum
 
 import structlog
@@ -10,6 +12,9 @@ from ai_baby_monitor.watcher import get_instructions_prompt
 
 logger = structlog.get_logger()
 
+# should_alert is the first field of the guided JSON, so it's decided a few tokens in
+_SHOULD_ALERT_PATTERN = re.compile(r'"should_alert"\s*:\s*(true|false)')
+
 
 class AwarenessLevel(str, Enum):
     LOW = "LOW"
@@ -23,6 +28,10 @@ class WatcherResponse(BaseModel):
     recommended_awareness_level: AwarenessLevel
 
 
+# Shared by every Watcher, so the schema is only generated once
+_JSON_SCHEMA = WatcherResponse.model_json_schema()
+
+
 class Watcher:
     def __init__(
         self,
@@ -30,6 +39,7 @@ class Watcher:
         vllm_host: str = "localhost",
         vllm_port: int = 8000,
         model_name: str = "Qwen/Qwen2.5-VL-7B-Instruct-AWQ",
+        request_timeout: float = 60.0,
     ):
         """
         Initialize the Watcher with instructions and vLLM server details.
@@ -38,19 +48,31 @@ class Watcher:
             instructions: List of monitoring instructions to check against frames
             vllm_host: Hostname of the vLLM server
             vllm_port: Port of the vLLM server
-            model_name: Name of the model to use for inference
+            model_name: Name of the model to use for inference. Must match the checkpoint
+                served by vLLM; the default is the AWQ-quantized Qwen2.5-VL
+            request_timeout: Seconds to wait for a vLLM response before giving up
         """
         self.instructions_prompt = get_instructions_prompt(instructions)
-        self.json_schema = WatcherResponse.model_json_schema()
+        self.json_schema = _JSON_SCHEMA
+
+        # Message parts that never change between calls, built once
+        self._system_message = {
+            "role": "system",
+            "content": "You are a helpful assistant and baby sitter.",
+        }
+        self._instructions_block = {"type": "text", "text": self.instructions_prompt}
+        self._extra_body = {"guided_json": self.json_schema}
 
         self.vllm_host = vllm_host
         self.vllm_port = vllm_port
         self.model_name = model_name
 
-        # Initialize OpenAI client for vLLM server
+        # Initialize OpenAI client for vLLM server. Its default timeout is 10
+        # minutes, far too long to go unwatched if the server hangs
         self.client = OpenAI(
             api_key="EMPTY",
             base_url=f"http://{vllm_host}:{vllm_port}/v1",
+            timeout=request_timeout,
         )
 
         logger.info(
@@ -61,18 +83,117 @@ class Watcher:
             instructions=instructions,
         )
 
-    def _frames_to_base64(self, frames: list[Frame]) -> list[str]:
-        """Convert JPEG-encoded frame data to base64 encoded strings."""
-        base64_frames = []
-        for frame in frames:
-            jpeg_bytes = bytes(frame.frame_data)
-            base64_str = base64.b64encode(jpeg_bytes).decode("utf-8")
-            base64_frames.append(base64_str)
+    def close(self):
+        """Close the pooled HTTP connections to the vLLM server."""
+        self.client.close()
+
+    def log_server_config(self):
+        """Log the models served by the vLLM server, warning if ours is missing."""
+        try:
+            models = self.client.models.list().data
+        except Exception as e:
+            logger.warning("Failed to query vLLM server models", error=e)
+            return
+
+        for model in models:
+            logger.info(
+                "vLLM server model",
+                model_id=model.id,
+                max_model_len=getattr(model, "max_model_len", None),
+            )
+
+        if self.model_name not in {model.id for model in models}:
+            logger.warning(
+                "Configured model is not served by vLLM server",
+                model_name=self.model_name,
+            )
+
+    def warmup(self):
+        """Send a tiny request with our guided_json schema, so vLLM compiles and
+        caches the schema's grammar before the first real window arrives."""
+        try:
+            self.client.chat.completions.create(
+                model=self.model_name,
+                messages=[{"role": "user", "content": "ping"}],
+                max_tokens=1,
+                extra_body=self._extra_body,
+            )
+        except Exception as e:
+            logger.warning("Failed to warm up vLLM server", error=e)
+
+    @staticmethod
+    def is_scene_unchanged(
+        frames: list[Frame], reference: Frame | None, max_distance: int = 2
+    ) -> bool:
+        """Check whether all frames look like the reference frame, by dHash.
+        Returns False when either side has no hash, so the frames get analyzed.
+        """
+        if reference is None or reference.dhash is None:
+            return False
+        return all(
+            frame.dhash is not None
+            and (frame.dhash ^ reference.dhash).bit_count() <= max_distance
+            for frame in frames
+        )
+
+    @staticmethod
+    def _dedupe_frames(frames: list[Frame], max_distance: int = 2) -> list[Frame]:
+        """Thin out near-identical frames, by dHash, keeping every `stride`-th frame.
+        The widest stride is used for which each dropped frame looks like the kept
+        frame before it. Strides divide the window, so the first and last frames are
+        kept and the video stays evenly spaced over the same span.
+        """
+        num_frames = len(frames)
+        if num_frames <= 2 or any(frame.dhash is None for frame in frames):
+            return frames
 
-        return base64_frames
+        for stride in range(num_frames - 1, 1, -1):
+            if (num_frames - 1) % stride:
+                continue
+            if all(
+                (frame.dhash ^ frames[i - i % stride].dhash).bit_count()
+                <= max_distance
+                for i, frame in enumerate(frames)
+            ):
+                return frames[::stride]
 
-    def _calculate_fps(self, frames: list[Frame], default_fps: int = 2) -> int:
-        """Calculate FPS from frame timestamps, defaulting to 2 if calculation fails."""
+        return frames
+
+    def _frames_to_base64(self, frames: list[Frame]) -> list[bytes]:
+        """Convert JPEG-encoded frame data to base64 encoded bytes."""
+        # The arrays are views over the bytes read from Redis; encode them in place
+        return [
+            binascii.b2a_base64(frame.frame_data, newline=False) for frame in frames
+        ]
+
+    def _stream_content(
+        self, request_kwargs: dict, on_alert: Callable[[], None]
+    ) -> str:
+        """Stream a completion and return its content, calling `on_alert` as soon
+        as the partial response sets should_alert to true."""
+        stream = self.client.chat.completions.create(**request_kwargs, stream=True)
+
+        chunks = []
+        should_alert = None
+        for chunk in stream:
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            chunks.append(chunk.choices[0].delta.content)
+
+            # Only scan the short prefix until should_alert is decided
+            if should_alert is None:
+                match = _SHOULD_ALERT_PATTERN.search("".join(chunks))
+                if match:
+                    should_alert = match.group(1) == "true"
+                    if should_alert:
+                        on_alert()
+
+        return "".join(chunks)
+
+    def _calculate_fps(self, frames: list[Frame], default_fps: float = 2) -> float:
+        """Calculate FPS from frame timestamps, defaulting to 2 if calculation fails.
+        Not rounded, as a thinned-out window can have well under 1 FPS.
+        """
         if len(frames) < 2:
             logger.warning("Too few frames to calculate FPS, using default of 2")
             return default_fps
@@ -82,7 +203,7 @@ class Watcher:
             if time_diff <= 0:
                 return default_fps
 
-            fps = round((len(frames) - 1) / time_diff)
+            fps = (len(frames) - 1) / time_diff
 
             # Return default if calculated FPS is unreasonable
             return default_fps if fps < 0.02 or fps > 60 else fps
@@ -92,10 +213,16 @@ class Watcher:
             return default_fps
 
     def process_frames(
-        self, frames: list[Frame], fps: int | None = None
+        self,
+        frames: list[Frame],
+        fps: float | None = None,
+        on_alert: Callable[[], None] | None = None,
     ) -> dict[str, str | bool]:
         """Process frames to detect instruction violations.
 
+        If `on_alert` is given, the response is streamed and `on_alert` is called as
+        soon as the model decides to alert, before the reasoning is generated.
+
         Returns:
             dict containing:
                 - success (bool): Whether processing completed successfully
@@ -112,52 +239,83 @@ class Watcher:
                 "error": "No frames provided",
             }
 
+        # Qwen2.5-VL groups frames in pairs, so a lone frame isn't worth a request
+        if len(frames) < 2:
+            logger.warning("Too few frames to process", num_frames=len(frames))
+            return {
+                "success": False,
+                "error": "Too few frames provided",
+            }
+
         try:
+            # Near-identical frames only add video tokens. The kept frames are every
+            # stride-th frame, so a given FPS drops by the stride. Otherwise FPS is
+            # estimated from the kept frames, which span the same time
+            kept_frames = self._dedupe_frames(frames)
+            if fps is not None and len(kept_frames) < len(frames):
+                fps /= (len(frames) - 1) // (len(kept_frames) - 1)
+            frames = kept_frames
+
             # Convert frames to base64
             base64_frames = self._frames_to_base64(frames)
 
-            # Create video URL with proper format for vLLM
-            encoded_video = f"data:video/jpeg;base64,{','.join(base64_frames)}"
+            # Create video URL with proper format for vLLM. Frames are joined as
+            # bytes and decoded once, rather than decoding every frame
+            video_b64 = b",".join(base64_frames).decode("ascii")
+            encoded_video = f"data:video/jpeg;base64,{video_b64}"
 
-            # Create message with instructions
+            # Instructions go before the video so the whole text prefix is identical
+            # on every call and is served from vLLM's prefix cache
             messages = [
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant and baby sitter.",
-                },
+                self._system_message,
                 {
                     "role": "user",
                     "content": [
+                        self._instructions_block,
                         {"type": "video_url", "video_url": {"url": encoded_video}},
-                        {"type": "text", "text": self.instructions_prompt},
                     ],
                 },
             ]
 
             # Send to vLLM server with proper mm_processor_kwargs and guided_json
-            response = self.client.chat.completions.create(
+            request_kwargs = dict(
                 model=self.model_name,
                 messages=messages,
                 temperature=0.1,
-                max_tokens=512,
+                # The prompt keeps reasoning short; the whole JSON fits well within
+                max_tokens=128,
                 extra_body={
+                    **self._extra_body,
                     "mm_processor_kwargs": {
                         "fps": fps or [self._calculate_fps(frames)]
                     },
-                    "guided_json": self.json_schema,
                 },
             )
-            
-            parsed_response = WatcherResponse.model_validate_json(
-                response.choices[0].message.content
-            )
+            if on_alert is None:
+                response = self.client.chat.completions.create(**request_kwargs)
+                content = response.choices[0].message.content
+            else:
+                content = self._stream_content(request_kwargs, on_alert)
+
+            # Responses cut off at max_tokens lack the closing brace. Catch that
+            # cheaply instead of building a ValidationError
+            stripped = (content or "").strip()
+            if not (stripped.startswith("{") and stripped.endswith("}")):
+                logger.error("Malformed model response", raw_response=content)
+                return {
+                    "success": False,
+                    "error": "Malformed JSON response",
+                    "raw_response": content,
+                }
+
+            parsed_response = WatcherResponse.model_validate_json(content)
 
             return {
                 "success": True,
                 "should_alert": parsed_response.should_alert,
                 "reasoning": parsed_response.reasoning,
                 "recommended_awareness_level": parsed_response.recommended_awareness_level,
-                "raw_response": response.choices[0].message.content,
+                "raw_response": content,
             }
 
         except Exception as e:
@@ -1,5 +1,7 @@
+import os
 from pathlib import Path
 
+import pytest
 import yaml
 
 from ai_baby_monitor.config import RoomConfig, load_room_config_file
@@ -15,6 +17,7 @@ def test_load_room_config_file_with_optional_fields(tmp_path: Path):
             "frame_height": 720,
             "subsampled_stream_maxlen": 100,
             "subsample_rate": 8,
+            "jpeg_quality": 70,
         },
         "instructions": ["custom instruction"],
     }
@@ -34,6 +37,7 @@ def test_load_room_config_file_with_optional_fields(tmp_path: Path):
     assert config.frame_height == 720
     assert config.subsampled_stream_maxlen == 100
     assert config.subsample_rate == 8
+    assert config.jpeg_quality == 70
 
     assert isinstance(config, RoomConfig)
 
@@ -61,4 +65,34 @@ def test_load_room_config_file_with_partial_optional_fields(tmp_path: Path):
     assert config.frame_height == 360  # default
     assert config.subsampled_stream_maxlen == 64  # default
     assert config.subsample_rate == 4  # default
+    assert config.jpeg_quality == 85  # default
     assert config.instructions == []  # default
+
+
+def test_load_room_config_file_is_cached_until_modified(tmp_path: Path):
+    """Test that unchanged files are parsed once and edits are picked up."""
+    sample = {"name": "cached_room", "camera": {"uri": "0"}}
+    config_path = tmp_path / "cached_room.yaml"
+    config_path.write_text(yaml.safe_dump(sample))
+
+    config = load_room_config_file(config_path)
+    assert load_room_config_file(str(config_path)) is config
+
+    sample["camera"]["frame_width"] = 1024
+    config_path.write_text(yaml.safe_dump(sample))
+    mtime_ns = config_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(config_path, ns=(mtime_ns, mtime_ns))
+
+    reloaded_config = load_room_config_file(config_path)
+    assert reloaded_config is not config
+    assert reloaded_config.frame_width == 1024
+
+
+def test_load_room_config_file_rejects_too_few_frames(tmp_path: Path):
+    """Test that a window of fewer than 2 frames is rejected when loading."""
+    sample = {"name": "one_frame", "camera": {"uri": "0", "num_frames_to_process": 1}}
+    config_path = tmp_path / "one_frame.yaml"
+    config_path.write_text(yaml.safe_dump(sample))
+
+    with pytest.raises(ValueError, match="num_frames_to_process must be at least 2"):
+        load_room_config_file(config_path)
@@ -5,7 +5,7 @@ import cv2
 import numpy as np
 import pytest
 
-from ai_baby_monitor.stream.camera_stream import CameraStream, Frame
+from ai_baby_monitor.stream.camera_stream import CameraStream, Frame, compute_dhash
 
 
 @pytest.fixture
@@ -76,6 +76,7 @@ def test_camera_stream_init_successful(camera_stream_no_save):
     assert stream.stream_writer is None
     assert stream.frame_idx == 0
     mock_capture.isOpened.assert_called_once()
+    mock_capture.set.assert_called_once_with(cv2.CAP_PROP_BUFFERSIZE, 1)
 
 
 def test_camera_stream_init_with_save(camera_stream_with_save):
@@ -124,6 +125,39 @@ def test_capture_new_frame_successful(mock_imencode, camera_stream_no_save):
     mock_imencode.assert_called_once()
     # Check that the raw frame was passed to imencode
     assert np.array_equal(mock_imencode.call_args[0][1], mock_raw_frame)
+    assert mock_imencode.call_args[0][2] == [cv2.IMWRITE_JPEG_QUALITY, 85]
+    assert frame_obj.dhash == compute_dhash(mock_raw_frame)
+
+
+@patch(
+    "ai_baby_monitor.stream.camera_stream.cv2.imencode",
+    return_value=(True, np.array([255, 0, 255], dtype=np.uint8)),
+)
+def test_capture_new_frame_reuses_resize_buffer(mock_imencode, camera_stream_no_save):
+    """Test that resized frames are written into the same buffer every capture."""
+    stream, mock_capture = camera_stream_no_save
+    stream.frame_shape = (320, 180)
+    mock_raw_frame = np.random.randint(0, 256, (480, 640, 3), dtype=np.uint8)
+    mock_capture.retrieve.return_value = (True, mock_raw_frame)
+
+    stream.capture_new_frame()
+    resized_frame = stream._resized_frame
+    stream.capture_new_frame()
+
+    assert resized_frame.shape == (180, 320, 3)
+    assert stream._resized_frame is resized_frame
+    assert mock_imencode.call_args[0][1] is resized_frame
+
+
+def test_compute_dhash():
+    """Test that similar frames hash alike and different frames don't."""
+    gradient = np.tile(np.arange(0, 256, 4, dtype=np.uint8), (48, 1))
+    frame = cv2.cvtColor(gradient, cv2.COLOR_GRAY2BGR)
+    brighter = cv2.add(frame, 10)
+    mirrored = frame[:, ::-1].copy()
+
+    assert compute_dhash(frame) == compute_dhash(brighter)
+    assert (compute_dhash(frame) ^ compute_dhash(mirrored)).bit_count() > 32
 
 
 def test_close_no_writer(camera_stream_no_save):
@@ -21,9 +21,17 @@ def mock_redis_client():
 @pytest.fixture
 def redis_handler(mock_redis_client: MagicMock):
     """Fixture for RedisStreamHandler initialized with a mock Redis client."""
-    with patch("redis.Redis", return_value=mock_redis_client) as mock_redis_constructor:
+    with (
+        patch("redis.ConnectionPool") as mock_pool_constructor,
+        patch("redis.Redis", return_value=mock_redis_client) as mock_redis_constructor,
+    ):
         handler = RedisStreamHandler(redis_host="mock_host", redis_port=1234)
-        mock_redis_constructor.assert_called_once_with(host="mock_host", port=1234)
+        mock_pool_constructor.assert_called_once_with(
+            host="mock_host", port=1234, max_connections=16, socket_keepalive=True
+        )
+        mock_redis_constructor.assert_called_once_with(
+            connection_pool=mock_pool_constructor.return_value
+        )
     return handler
 
 
@@ -43,6 +51,19 @@ def sample_frame(sample_frame_data: np.ndarray) -> Frame:
     )
 
 
+@patch("ai_baby_monitor.stream.redis_stream.logger")
+@patch("ai_baby_monitor.stream.redis_stream.HIREDIS_AVAILABLE", False)
+@patch("redis.Redis")
+@patch("redis.ConnectionPool")
+def test_init_warns_without_hiredis(
+    mock_pool_constructor, mock_redis_constructor, mock_logger
+):
+    """Test that a missing hiredis parser is reported at construction."""
+    RedisStreamHandler(redis_host="mock_host", redis_port=1234)
+
+    mock_logger.warning.assert_called_once()
+
+
 def test_serialize_deserialize_frame(sample_frame: Frame):
     """Test serialization and deserialization of a Frame object."""
     serialized_data = RedisStreamHandler.serialize_frame(sample_frame)
@@ -53,7 +74,10 @@ def test_serialize_deserialize_frame(sample_frame: Frame):
     assert "frame_idx" in serialized_data
     assert serialized_data["timestamp"] == sample_frame.timestamp.isoformat()
     assert serialized_data["frame_idx"] == sample_frame.frame_idx
-    assert serialized_data["frame_bytes"] == sample_frame.frame_data.tobytes()
+    # The array buffer is exposed as a memoryview rather than copied with tobytes().
+    # Whether it is sent without a copy is up to the redis-py packer
+    assert isinstance(serialized_data["frame_bytes"], memoryview)
+    assert bytes(serialized_data["frame_bytes"]) == sample_frame.frame_data.tobytes()
 
     # deserialize_frame expects byte keys and byte values (for strings) from Redis
     redis_formatted_data = {
@@ -66,8 +90,52 @@ def test_serialize_deserialize_frame(sample_frame: Frame):
 
     assert deserialized_frame is not None
     assert np.array_equal(deserialized_frame.frame_data, sample_frame.frame_data)
+    # A read-only view over the bytes from Redis, not a copy
+    assert deserialized_frame.frame_data.base is not None
+    assert not deserialized_frame.frame_data.flags.writeable
     assert deserialized_frame.timestamp == sample_frame.timestamp
     assert deserialized_frame.frame_idx == sample_frame.frame_idx
+    assert deserialized_frame.dhash is None
+    assert "dhash" not in serialized_data
+
+
+def test_serialize_frame_non_contiguous(sample_frame: Frame):
+    """Test that non-contiguous frame data is serialized in order."""
+    sample_frame.frame_data = np.arange(10, dtype=np.uint8)[::2]
+    serialized_data = RedisStreamHandler.serialize_frame(sample_frame)
+
+    assert bytes(serialized_data["frame_bytes"]) == bytes([0, 2, 4, 6, 8])
+
+
+@pytest.mark.parametrize("shape", [(4, 6), (2, 3, 4)])
+def test_serialize_frame_multidimensional(sample_frame: Frame, shape: tuple):
+    """Test that the serialized length of N-D frame data is its byte count."""
+    frame_data = np.arange(np.prod(shape), dtype=np.uint8).reshape(shape)
+    sample_frame.frame_data = frame_data
+    serialized_data = RedisStreamHandler.serialize_frame(sample_frame)
+
+    # redis-py uses len() as the RESP bulk length
+    assert len(serialized_data["frame_bytes"]) == frame_data.nbytes
+    assert bytes(serialized_data["frame_bytes"]) == frame_data.tobytes()
+
+
+def test_serialize_deserialize_frame_with_dhash(sample_frame: Frame):
+    """Test that the optional dHash survives serialization and deserialization."""
+    sample_frame.dhash = 2**64 - 1
+    serialized_data = RedisStreamHandler.serialize_frame(sample_frame)
+
+    assert serialized_data["dhash"] == sample_frame.dhash
+
+    redis_formatted_data = {
+        b"frame_bytes": sample_frame.frame_data.tobytes(),
+        b"timestamp": sample_frame.timestamp.isoformat().encode("utf-8"),
+        b"frame_idx": str(sample_frame.frame_idx).encode("utf-8"),
+        b"dhash": str(sample_frame.dhash).encode("utf-8"),
+    }
+
+    deserialized_frame = RedisStreamHandler.deserialize_frame(redis_formatted_data)
+
+    assert deserialized_frame.dhash == sample_frame.dhash
 
 
 def test_add_frame(
@@ -94,6 +162,64 @@ def test_add_frame(
     assert call_args["fields"]["frame_idx"] == expected_fields["frame_idx"]
 
 
+def test_add_frames_batch(
+    redis_handler: RedisStreamHandler, mock_redis_client: MagicMock, sample_frame: Frame
+):
+    """Test adding several frames to a stream through one pipeline."""
+    mock_pipeline = MagicMock()
+    mock_pipeline.execute.return_value = [b"id1", b"id2", b"id3"]
+    mock_redis_client.pipeline.return_value = mock_pipeline
+
+    frames = [
+        Frame(
+            frame_data=sample_frame.frame_data,
+            timestamp=sample_frame.timestamp,
+            frame_idx=sample_frame.frame_idx + i,
+        )
+        for i in range(3)
+    ]
+    entry_ids = redis_handler.add_frames_batch(frames, "room:subsampled", maxlen=64)
+
+    assert entry_ids == [b"id1", b"id2", b"id3"]
+    mock_redis_client.pipeline.assert_called_once_with(transaction=False)
+    mock_redis_client.xadd.assert_not_called()
+    mock_pipeline.execute.assert_called_once()
+
+    assert mock_pipeline.xadd.call_count == 3
+    for call, frame in zip(mock_pipeline.xadd.call_args_list, frames):
+        assert call[1]["name"] == "room:subsampled"
+        assert call[1]["maxlen"] == 64
+        assert call[1]["approximate"] is True
+        assert call[1]["fields"]["frame_idx"] == frame.frame_idx
+        assert call[1]["fields"]["timestamp"] == frame.timestamp.isoformat()
+
+
+def test_add_frame_to_streams(
+    redis_handler: RedisStreamHandler, mock_redis_client: MagicMock, sample_frame: Frame
+):
+    """Test adding a frame to several streams through one pipeline."""
+    mock_pipeline = MagicMock()
+    mock_pipeline.execute.return_value = [b"realtime_id", b"subsampled_id"]
+    mock_redis_client.pipeline.return_value = mock_pipeline
+
+    streams = [("room:realtime", 3, False), ("room:subsampled", 64, True)]
+    entry_ids = redis_handler.add_frame_to_streams(sample_frame, streams)
+
+    assert entry_ids == [b"realtime_id", b"subsampled_id"]
+    mock_redis_client.pipeline.assert_called_once_with(transaction=False)
+    mock_redis_client.xadd.assert_not_called()
+    mock_pipeline.execute.assert_called_once()
+
+    assert mock_pipeline.xadd.call_count == 2
+    for call, (key, maxlen, approximate) in zip(
+        mock_pipeline.xadd.call_args_list, streams
+    ):
+        assert call[1]["name"] == key
+        assert call[1]["maxlen"] == maxlen
+        assert call[1]["approximate"] == approximate
+        assert call[1]["fields"]["frame_idx"] == sample_frame.frame_idx
+
+
 def test_get_latest_frames(
     redis_handler: RedisStreamHandler,
     mock_redis_client: MagicMock,
@@ -145,6 +271,116 @@ def test_get_latest_frames(
     assert frames[1].frame_idx == 101
 
 
+def test_get_latest_frame_entries(
+    redis_handler: RedisStreamHandler,
+    mock_redis_client: MagicMock,
+    sample_frame: Frame,
+):
+    """Test that the latest frames are returned with their entry IDs, oldest first."""
+    frame_raw_data = RedisStreamHandler.serialize_frame(sample_frame)
+    frame_raw_data = {
+        b"frame_bytes": bytes(frame_raw_data["frame_bytes"]),
+        b"timestamp": frame_raw_data["timestamp"].encode("utf-8"),
+        b"frame_idx": str(frame_raw_data["frame_idx"]).encode("utf-8"),
+    }
+    mock_redis_client.xrevrange.return_value = [
+        (b"entry_id_2", frame_raw_data),
+        (b"entry_id_1", {b"frame_bytes": b"missing fields"}),  # Dropped
+        (b"entry_id_0", frame_raw_data),
+    ]
+
+    entries = redis_handler.get_latest_frame_entries("test_stream", count=3)
+
+    assert [entry_id for entry_id, _ in entries] == [b"entry_id_0", b"entry_id_2"]
+    assert all(frame.frame_idx == sample_frame.frame_idx for _, frame in entries)
+
+
+def test_get_latest_frames_multi(
+    redis_handler: RedisStreamHandler, mock_redis_client: MagicMock, sample_frame: Frame
+):
+    """Test getting the latest frames of several streams through one pipeline."""
+
+    def raw_frame(frame_idx: int) -> dict:
+        return {
+            b"frame_bytes": sample_frame.frame_data.tobytes(),
+            b"timestamp": sample_frame.timestamp.isoformat().encode("utf-8"),
+            b"frame_idx": str(frame_idx).encode("utf-8"),
+        }
+
+    mock_pipeline = MagicMock()
+    # xrevrange returns newest first
+    mock_pipeline.execute.return_value = [
+        [(b"id_2", raw_frame(2)), (b"id_1", raw_frame(1))],
+        [(b"id_7", raw_frame(7))],
+    ]
+    mock_redis_client.pipeline.return_value = mock_pipeline
+
+    keys = ["bedroom:subsampled", "living_room:subsampled"]
+    frames_by_key = redis_handler.get_latest_frames_multi(keys, count=2)
+
+    mock_redis_client.pipeline.assert_called_once_with(transaction=False)
+    mock_redis_client.xrevrange.assert_not_called()
+    mock_pipeline.execute.assert_called_once()
+    for key in keys:
+        mock_pipeline.xrevrange.assert_any_call(name=key, max="+", min="-", count=2)
+
+    assert list(frames_by_key) == keys
+    assert [f.frame_idx for f in frames_by_key["bedroom:subsampled"]] == [1, 2]
+    assert [f.frame_idx for f in frames_by_key["living_room:subsampled"]] == [7]
+
+
+def test_get_latest_frames_and_logs(
+    redis_handler: RedisStreamHandler, mock_redis_client: MagicMock, sample_frame: Frame
+):
+    """Test getting the latest frames and logs through one pipeline."""
+    frame_raw_data = {
+        b"frame_bytes": sample_frame.frame_data.tobytes(),
+        b"timestamp": sample_frame.timestamp.isoformat().encode("utf-8"),
+        b"frame_idx": str(sample_frame.frame_idx).encode("utf-8"),
+    }
+    log_entries = [(b"log_id_2", {b"reasoning": b"newer"}), (b"log_id_1", {})]
+    mock_pipeline = MagicMock()
+    mock_pipeline.execute.return_value = [[(b"frame_id", frame_raw_data)], log_entries]
+    mock_redis_client.pipeline.return_value = mock_pipeline
+
+    frames, logs = redis_handler.get_latest_frames_and_logs(
+        "room:realtime", "room:logs", num_logs=2
+    )
+
+    mock_redis_client.pipeline.assert_called_once_with(transaction=False)
+    mock_redis_client.xrevrange.assert_not_called()
+    mock_pipeline.xrevrange.assert_any_call(
+        name="room:realtime", max="+", min="-", count=1
+    )
+    mock_pipeline.xrevrange.assert_any_call(name="room:logs", max="+", min="-", count=2)
+    mock_pipeline.execute.assert_called_once()
+
+    assert len(frames) == 1
+    assert frames[0][0] == b"frame_id"
+    assert frames[0][1].frame_idx == sample_frame.frame_idx
+    # Oldest first, like get_latest_logs
+    assert logs == log_entries[::-1]
+
+
+def test_get_latest_frames_and_logs_after_last_frame(
+    redis_handler: RedisStreamHandler, mock_redis_client: MagicMock
+):
+    """Test that the frame range excludes the frame the caller already has."""
+    mock_pipeline = MagicMock()
+    mock_pipeline.execute.return_value = [[], []]
+    mock_redis_client.pipeline.return_value = mock_pipeline
+
+    frames, logs = redis_handler.get_latest_frames_and_logs(
+        "room:realtime", "room:logs", last_frame_id=b"1700000000000-0"
+    )
+
+    mock_pipeline.xrevrange.assert_any_call(
+        name="room:realtime", max="+", min="(1700000000000-0", count=1
+    )
+    assert frames == []
+    assert logs == []
+
+
 def test_add_logs(redis_handler: RedisStreamHandler, mock_redis_client: MagicMock):
     """Test adding logs to the Redis stream."""
     key = "log_stream"
@@ -209,3 +445,29 @@ def test_get_latest_logs(
         (b"log_id_2", {b"timestamp": b"ts2", b"message": b"Log 2"}),
     ]
     assert logs == expected_logs_final_order
+
+
+def test_wait_for_new_entries(
+    redis_handler: RedisStreamHandler, mock_redis_client: MagicMock
+):
+    """Test blocking for new entries with XREAD."""
+    key = "test_stream"
+    new_entries = [(b"entry_id_3", {b"frame_idx": b"102"})]
+    mock_redis_client.xread = MagicMock(return_value=[[key.encode(), new_entries]])
+
+    entries = redis_handler.wait_for_new_entries(key, last_id="1-0", block_ms=500)
+
+    mock_redis_client.xread.assert_called_once_with({key: "1-0"}, count=1, block=500)
+    assert entries == new_entries
+
+
+def test_wait_for_new_entries_timeout(
+    redis_handler: RedisStreamHandler, mock_redis_client: MagicMock
+):
+    """Test that a blocking read without new entries returns an empty list."""
+    mock_redis_client.xread = MagicMock(return_value=[])
+
+    assert redis_handler.wait_for_new_entries("test_stream") == []
+    mock_redis_client.xread.assert_called_once_with(
+        {"test_stream": "$"}, count=1, block=1000
+    )
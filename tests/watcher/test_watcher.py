@@ -2,10 +2,11 @@ import pytest
 from ai_baby_monitor.watcher.base_prompt import get_instructions_prompt
 from ai_baby_monitor.watcher import WatcherResponse, AwarenessLevel
 from pydantic import ValidationError
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from ai_baby_monitor.watcher import Watcher
 from ai_baby_monitor.stream import Frame
 import datetime
+import numpy as np
 
 def test_get_instructions_prompt_success():
     instructions = ["Instruction 1", "Instruction 2"]
@@ -18,12 +19,16 @@ If the instructions are violated, you should alert the user.
 You should also recommend the awareness level based on the image.
 Please generate a structured response in raw JSON format:
 - should_alert (boolean)
-- reasoning (string)
+- reasoning (string; one or two short sentences)
 - recommended_awareness_level (Enum AwarenessLevel; one of: LOW, MEDIUM, HIGH)
 Always respond in English, regardless of the content in the images.
         """
     assert get_instructions_prompt(instructions) == expected_prompt
 
+def test_get_instructions_prompt_is_cached():
+    instructions = ["Instruction 1", "Instruction 2"]
+    assert get_instructions_prompt(instructions) is get_instructions_prompt(list(instructions))
+
 def test_get_instructions_prompt_empty_list():
     with pytest.raises(ValueError, match="Instructions must be a non-empty list"):
         get_instructions_prompt([])
@@ -38,7 +43,7 @@ If the instructions are violated, you should alert the user.
 You should also recommend the awareness level based on the image.
 Please generate a structured response in raw JSON format:
 - should_alert (boolean)
-- reasoning (string)
+- reasoning (string; one or two short sentences)
 - recommended_awareness_level (Enum AwarenessLevel; one of: LOW, MEDIUM, HIGH)
 Always respond in English, regardless of the content in the images.
         """
@@ -88,74 +93,244 @@ def test_watcher_init(mock_get_instructions_prompt):
     assert watcher.vllm_port == 1234
     assert watcher.model_name == "test_model"
     assert str(watcher.client.base_url) == "http://test_host:1234/v1/"
+    assert watcher.client.timeout == 60.0
 
-# Test for Watcher._calculate_fps
-def test_watcher_calculate_fps_valid():
+def test_watcher_json_schema_is_shared():
+    assert Watcher(instructions=["a"]).json_schema is Watcher(instructions=["b"]).json_schema
+
+def test_watcher_close():
+    watcher = Watcher(instructions=["Test"])
+    with patch.object(watcher.client, "close") as mock_close:
+        watcher.close()
+    mock_close.assert_called_once()
+
+@patch('ai_baby_monitor.watcher.watcher.logger')
+def test_watcher_log_server_config_missing_model(mock_logger):
+    watcher = Watcher(instructions=["Test"], model_name="test_model")
+    served_model = MagicMock(id="other_model", max_model_len=32768)
+    with patch.object(watcher.client.models, "list") as mock_list:
+        mock_list.return_value = MagicMock(data=[served_model])
+        watcher.log_server_config()
+
+    mock_logger.info.assert_any_call(
+        "vLLM server model", model_id="other_model", max_model_len=32768
+    )
+    mock_logger.warning.assert_called_once_with(
+        "Configured model is not served by vLLM server", model_name="test_model"
+    )
+
+@patch('ai_baby_monitor.watcher.watcher.logger')
+def test_watcher_warmup(mock_logger):
+    watcher = Watcher(instructions=["Test"], model_name="test_model")
+    with patch.object(watcher.client.chat.completions, "create") as mock_create:
+        mock_create.side_effect = ConnectionError("vLLM is down")
+        watcher.warmup()
+
+    mock_create.assert_called_once()
+    assert mock_create.call_args[1]["model"] == "test_model"
+    assert mock_create.call_args[1]["max_tokens"] == 1
+    assert mock_create.call_args[1]["extra_body"]["guided_json"] == watcher.json_schema
+    mock_logger.warning.assert_called_once()
+
+def test_watcher_process_frames_streams_alert():
     watcher = Watcher(instructions=["Test"])
     now = datetime.datetime.now()
     frames = [
-        Frame(frame_data=[], timestamp=now, frame_idx=0),
-        Frame(frame_data=[], timestamp=now + datetime.timedelta(seconds=1), frame_idx=1),
-        Frame(frame_data=[], timestamp=now + datetime.timedelta(seconds=2), frame_idx=2), # 3 frames, 2 seconds diff -> 1 FPS
+        Frame(
+            frame_data=np.frombuffer(b"jpeg", dtype=np.uint8),
+            timestamp=now + datetime.timedelta(seconds=i),
+            frame_idx=i,
+        )
+        for i in range(2)
+    ]
+    deltas = [
+        '{"should_',
+        'alert": true, "reasoning": "Baby is climbing", ',
+        '"recommended_awareness_level": "HIGH"}',
     ]
-    assert watcher._calculate_fps(frames) == 1
+    on_alert = MagicMock()
+
+    def stream_chunks():
+        for i, delta in enumerate(deltas):
+            # The alert fires as soon as should_alert is streamed
+            assert on_alert.call_count == (1 if i == 2 else 0)
+            yield MagicMock(choices=[MagicMock(delta=MagicMock(content=delta))])
+
+    with patch.object(watcher.client.chat.completions, "create") as mock_create:
+        mock_create.return_value = stream_chunks()
+        result = watcher.process_frames(frames, on_alert=on_alert)
+
+    assert mock_create.call_args[1]["stream"] is True
+    on_alert.assert_called_once()
+    assert result["success"]
+    assert result["should_alert"]
+    assert result["reasoning"] == "Baby is climbing"
+    assert result["raw_response"] == "".join(deltas)
 
-def test_watcher_calculate_fps_default_fps_param():
+def test_watcher_process_frames_scales_given_fps_after_dedupe():
     watcher = Watcher(instructions=["Test"])
     now = datetime.datetime.now()
     frames = [
-        Frame(frame_data=[], timestamp=now, frame_idx=0),
-        Frame(frame_data=[], timestamp=now + datetime.timedelta(seconds=1), frame_idx=1),
-        Frame(frame_data=[], timestamp=now + datetime.timedelta(seconds=2), frame_idx=2),
+        Frame(
+            frame_data=np.frombuffer(b"jpeg", dtype=np.uint8),
+            timestamp=now + datetime.timedelta(seconds=i / 2),
+            frame_idx=i,
+            dhash=0b1011,
+        )
+        for i in range(5)
     ]
-    assert watcher._calculate_fps(frames, default_fps=5) == 1 # Should still calculate correctly
+    content = (
+        '{"should_alert": false, "reasoning": "Baby is asleep", '
+        '"recommended_awareness_level": "LOW"}'
+    )
 
+    with patch.object(watcher.client.chat.completions, "create") as mock_create:
+        mock_create.return_value.choices[0].message.content = content
+        result = watcher.process_frames(frames, fps=2)
 
-def test_watcher_calculate_fps_too_few_frames():
-    watcher = Watcher(instructions=["Test"])
-    frames = [Frame(frame_data=[], timestamp=datetime.datetime.now(), frame_idx=0)]
-    assert watcher._calculate_fps(frames, default_fps=3) == 3
+    # A static window is thinned to its ends, every 4th frame, so 2 FPS becomes 0.5
+    assert result["success"]
+    mm_processor_kwargs = mock_create.call_args[1]["extra_body"]["mm_processor_kwargs"]
+    assert mm_processor_kwargs["fps"] == 0.5
 
-def test_watcher_calculate_fps_zero_time_diff():
+@patch('ai_baby_monitor.watcher.watcher.WatcherResponse.model_validate_json')
+def test_watcher_process_frames_malformed_response(mock_validate_json):
     watcher = Watcher(instructions=["Test"])
     now = datetime.datetime.now()
     frames = [
-        Frame(frame_data=[], timestamp=now, frame_idx=0),
-        Frame(frame_data=[], timestamp=now, frame_idx=1)
+        Frame(
+            frame_data=np.frombuffer(b"jpeg", dtype=np.uint8),
+            timestamp=now + datetime.timedelta(seconds=i),
+            frame_idx=i,
+        )
+        for i in range(2)
     ]
-    assert watcher._calculate_fps(frames, default_fps=4) == 4
-    
-def test_watcher_calculate_fps_negative_time_diff(): # Should also use default
+    truncated = '{"should_alert": false, "reasoning": "The baby is'
+    response = MagicMock(choices=[MagicMock(message=MagicMock(content=truncated))])
+
+    with patch.object(watcher.client.chat.completions, "create") as mock_create:
+        mock_create.return_value = response
+        result = watcher.process_frames(frames)
+
+    mock_validate_json.assert_not_called()
+    assert result["success"] is False
+    assert result["error"] == "Malformed JSON response"
+    assert result["raw_response"] == truncated
+
+def test_watcher_process_frames_too_few_frames():
     watcher = Watcher(instructions=["Test"])
+    frames = [Frame(frame_data=None, timestamp=datetime.datetime.now(), frame_idx=0)]
+
+    with patch.object(watcher.client.chat.completions, "create") as mock_create:
+        result = watcher.process_frames(frames)
+
+    mock_create.assert_not_called()
+    assert result == {"success": False, "error": "Too few frames provided"}
+
+def test_watcher_is_scene_unchanged():
     now = datetime.datetime.now()
     frames = [
-        Frame(frame_data=[], timestamp=now + datetime.timedelta(seconds=1), frame_idx=0),
-        Frame(frame_data=[], timestamp=now, frame_idx=1)
+        Frame(frame_data=None, timestamp=now, frame_idx=i, dhash=0b1011 ^ (i & 1))
+        for i in range(4)
     ]
-    assert watcher._calculate_fps(frames, default_fps=4) == 4
+    reference = Frame(frame_data=None, timestamp=now, frame_idx=-1, dhash=0b1011)
+    moved = Frame(frame_data=None, timestamp=now, frame_idx=4, dhash=0b0100)
+    unhashed = Frame(frame_data=None, timestamp=now, frame_idx=5)
 
+    assert Watcher.is_scene_unchanged(frames, reference)
+    assert not Watcher.is_scene_unchanged(frames + [moved], reference)
+    assert not Watcher.is_scene_unchanged(frames + [unhashed], reference)
+    assert not Watcher.is_scene_unchanged(frames, unhashed)
+    assert not Watcher.is_scene_unchanged(frames, None)
 
-def test_watcher_calculate_fps_unreasonable_low_fps():
-    watcher = Watcher(instructions=["Test"])
+def test_watcher_dedupe_frames():
     now = datetime.datetime.now()
+    dhashes = [0b0000, 0b0001, 0b0000, 0b1111, 0b1110, 0b1111, 0b0000]
     frames = [
-        Frame(frame_data=[], timestamp=now, frame_idx=0),
-        Frame(frame_data=[], timestamp=now + datetime.timedelta(seconds=1000), frame_idx=1), # (2-1)/1000 = 0.001 FPS
+        Frame(frame_data=None, timestamp=now, frame_idx=i, dhash=dhash)
+        for i, dhash in enumerate(dhashes)
     ]
-    assert watcher._calculate_fps(frames, default_fps=2) == 2
 
-def test_watcher_calculate_fps_unreasonable_high_fps():
+    # Stride 6 would drop frame 3, which moved. With stride 3, frames 1-2 look like
+    # frame 0 and frames 4-5 like frame 3
+    kept = Watcher._dedupe_frames(frames)
+    assert [frame.frame_idx for frame in kept] == [0, 3, 6]
+
+    # A moving frame that fits no stride keeps the whole window, as does a frame
+    # without a dHash
+    frames[1].dhash = 0b1111
+    assert Watcher._dedupe_frames(frames) == frames
+    frames[1].dhash = None
+    assert Watcher._dedupe_frames(frames) == frames
+    assert Watcher._dedupe_frames(frames[:2]) == frames[:2]
+
+def test_watcher_frames_to_base64():
     watcher = Watcher(instructions=["Test"])
     now = datetime.datetime.now()
     frames = [
-        Frame(frame_data=[], timestamp=now, frame_idx=0),
-        Frame(frame_data=[], timestamp=now + datetime.timedelta(microseconds=100), frame_idx=1), # (2-1)/0.0001 = 10000 FPS
+        Frame(
+            frame_data=np.frombuffer(b"jpeg bytes", dtype=np.uint8),
+            timestamp=now,
+            frame_idx=0,
+        )
     ]
-    assert watcher._calculate_fps(frames, default_fps=2) == 2
-    
+    assert watcher._frames_to_base64(frames) == [b"anBlZyBieXRlcw=="]
+
+# Test for Watcher._calculate_fps
+@pytest.fixture(scope="module")
+def watcher():
+    """Watcher shared by the FPS tests, which don't change its state."""
+    return Watcher(instructions=["Test"])
+
+@pytest.mark.parametrize(
+    "seconds, default_fps, expected_fps",
+    [
+        ([0, 1, 2], 2, 1),  # 3 frames, 2 seconds diff -> 1 FPS
+        ([0, 1, 2], 5, 1),  # Should still calculate correctly
+        ([0], 3, 3),  # Too few frames
+        ([0, 0], 4, 4),  # Zero time diff
+        ([1, 0], 4, 4),  # Negative time diff
+        ([0, 1000], 2, 2),  # (2-1)/1000 = 0.001 FPS is unreasonably low
+        ([0, 0.0001], 2, 2),  # (2-1)/0.0001 = 10000 FPS is unreasonably high
+    ],
+    ids=[
+        "valid",
+        "default_fps_param",
+        "too_few_frames",
+        "zero_time_diff",
+        "negative_time_diff",
+        "unreasonable_low_fps",
+        "unreasonable_high_fps",
+    ],
+)
+def test_watcher_calculate_fps(watcher, seconds, default_fps, expected_fps):
+    now = datetime.datetime.now()
+    frames = [
+        Frame(frame_data=[], timestamp=now + datetime.timedelta(seconds=s), frame_idx=i)
+        for i, s in enumerate(seconds)
+    ]
+    assert watcher._calculate_fps(frames, default_fps=default_fps) == expected_fps
+
+def test_watcher_calculate_fps_after_dedupe(watcher):
+    """A static window thinned to its ends keeps its real, sub-1 FPS."""
+    now = datetime.datetime.now()
+    frames = [
+        Frame(
+            frame_data=None,
+            timestamp=now + datetime.timedelta(seconds=i * 2 / 15),
+            frame_idx=i,
+            dhash=0b1011,
+        )
+        for i in range(16)
+    ]
+
+    kept = watcher._dedupe_frames(frames)
+
+    assert kept == [frames[0], frames[-1]]
+    assert watcher._calculate_fps(kept) == pytest.approx(0.5)
+
 @patch('ai_baby_monitor.watcher.watcher.logger')
-def test_watcher_calculate_fps_exception(mock_logger):
-    watcher = Watcher(instructions=["Test"])
+def test_watcher_calculate_fps_exception(mock_logger, watcher):
     frames = [
         Frame(frame_data=[], timestamp="not a datetime", frame_idx=0), # This will cause an error
         Frame(frame_data=[], timestamp="also not a datetime", frame_idx=1)